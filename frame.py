@@ -1,16 +1,18 @@
 import abc
 import struct
+from time import perf_counter_ns
 from abc import ABCMeta
 from asyncio import Future
 from enum import IntEnum, unique
-from typing import Tuple, Optional, Union
+from functools import lru_cache
+from typing import Tuple, Optional, Union, List, NamedTuple, Type, Callable
 
 from rsocket.error_codes import ErrorCode
 from rsocket.exceptions import RSocketProtocolError, ParseError, RSocketUnknownFrameType
 from rsocket.fragment import Fragment
 from rsocket.frame_fragmenter import data_to_fragments_if_required
 from rsocket.frame_helpers import is_flag_set, unpack_position, pack_position, unpack_24bit, pack_24bit, unpack_32bit, \
-    ensure_bytes, pack_string, unpack_string
+    ensure_bytes, pack_string, unpack_string, safe_len
 from rsocket.logger import logger
 
 PROTOCOL_MAJOR_VERSION = 1
@@ -31,6 +33,14 @@ _FLAG_NEXT_BIT = 0x20
 
 MINIMUM_FRAGMENT_SIZE_BYTES = 64
 
+PAYLOAD_FRAME_POOL_SIZE = 256
+
+FRAME_METRICS_SAMPLE_EVERY = 64
+FRAME_METRICS_HISTOGRAM_BUCKETS = 40
+
+# Marks a frame without a fragment size that has already been handed to the sender.
+_UNFRAGMENTED_FRAME_SENT = object()
+
 
 @unique
 class FrameType(IntEnum):
@@ -73,17 +83,17 @@ def parse_header(frame: Header, buffer: bytes, offset: int) -> int:
     frame.stream_id, frame.frame_type, flags = struct.unpack_from('>IBB', buffer, offset)
     flags |= (frame.frame_type & 3) << 8
     frame_type_id = frame.frame_type >> 2
+    entry = _frame_type_table[frame_type_id]
 
-    try:
-        frame.frame_type = FrameType(frame_type_id)
-    except ValueError as exception:
-        if frame.stream_id != 0:
-            #import pdb; pdb.set_trace()
-            frame.stream_id = 1
-            frame.frame_type = FrameType.PAYLOAD
-            flags = 32
-        else:
-            raise RSocketUnknownFrameType(frame_type_id) from exception
+    if entry is not None:
+        frame.frame_type = entry.frame_type
+    elif frame.stream_id != 0:
+        #import pdb; pdb.set_trace()
+        frame.stream_id = 1
+        frame.frame_type = FrameType.PAYLOAD
+        flags = 32
+    else:
+        raise RSocketUnknownFrameType(frame_type_id)
 
     frame.flags_ignore = is_flag_set(flags, _FLAG_IGNORE_BIT)
     frame.flags_metadata = is_flag_set(flags, _FLAG_METADATA_BIT)
@@ -143,6 +153,15 @@ class Frame(Header, metaclass=ABCMeta):
         ...
 
     def serialize(self, middle=b'', flags: int = 0) -> bytes:
+        return b''.join(self._serialize_buffers(middle, flags))
+
+    def serialize_buffers(self) -> List[Union[bytes, memoryview]]:
+        return [self.serialize()]
+
+    def _serialize_buffers(self, middle=b'', flags: int = 0) -> List[Union[bytes, memoryview]]:
+        # The header, middle section and metadata length are packed into one
+        # bytes object. Metadata and data are returned as views so that the
+        # transport can write them without joining.
         flags &= ~(_FLAG_IGNORE_BIT | _FLAG_METADATA_BIT)
         if self.flags_ignore:
             flags |= _FLAG_IGNORE_BIT
@@ -152,33 +171,21 @@ class Frame(Header, metaclass=ABCMeta):
 
         self.length = self._compute_frame_length(middle)
 
-        offset = 0
-        buffer = bytearray(self.length)
-
-        struct.pack_into('>I', buffer, offset, self.stream_id)
-        offset += 4
-
-        buffer[offset] = (self.frame_type << 2) | (flags >> 8)
-        offset += 1
-        buffer[offset] = flags & 0xff
-        offset += 1
-
-        buffer[offset:offset + len(middle)] = middle[:]
-        offset += len(middle)
+        header = struct.pack('>IBB',
+                             self.stream_id,
+                             (self.frame_type << 2) | (flags >> 8),
+                             flags & 0xff) + middle
+        buffers = [header]
 
         if self.flags_metadata and self.metadata:
-            length = len(self.metadata)
             if not self.metadata_only:
-                buffer[offset:offset + 3] = pack_24bit(length)
-                offset += 3
-            buffer[offset:offset + length] = self.metadata[:]
-            offset += length
+                buffers[0] = header + pack_24bit(len(self.metadata))
+            buffers.append(memoryview(self.metadata))
 
         if not self.metadata_only and self.data:
-            buffer[offset:offset + len(self.data)] = self.data[:]
-            offset += len(self.data)
+            buffers.append(memoryview(self.data))
 
-        return bytes(buffer)
+        return buffers
 
     def _compute_frame_length(self, middle: bytes) -> int:
         header_length = HEADER_LENGTH
@@ -195,12 +202,16 @@ class Frame(Header, metaclass=ABCMeta):
         return length
 
     def __str__(self):
-        return str(f'({FrameType(self.frame_type).name},{self.data},{self.metadata},{self.flags_complete})')
+        return str(f'({frame_type_entry(self.frame_type).frame_type.name},{self.data},{self.metadata},{self.flags_complete})')
 
 
 class FrameFragmentMixin(metaclass=abc.ABCMeta):
+    __slots__ = ()
 
     def get_next_fragment(self, requires_length_header: bool = True) -> Optional['Frame']:
+        if self.fragment_size_bytes is None:
+            return self._next_unfragmented()
+
         if self.fragment_generator is None:
             self.fragment_generator = data_to_fragments_if_required(
                 self.data,
@@ -218,6 +229,21 @@ class FrameFragmentMixin(metaclass=abc.ABCMeta):
         except StopIteration:
             return None
 
+    def _next_unfragmented(self) -> Optional['Frame']:
+        # A frame without a fragment size is sent as is rather than copied
+        # into a single fragment frame.
+        if self.fragment_generator is _UNFRAGMENTED_FRAME_SENT:
+            return None
+
+        self.fragment_generator = _UNFRAGMENTED_FRAME_SENT
+        self.flags_follows = False
+
+        if self.frame_type == FrameType.PAYLOAD:
+            # As in new_frame_fragment, NEXT is derived from the payload when serialized.
+            self.flags_next = False
+
+        return self
+
 
 class SetupFrame(Frame):
     __slots__ = (
@@ -367,9 +393,7 @@ class KeepAliveFrame(Frame):
 
 
 class RequestFrame(Frame):
-    __slots__ = (
-        'flags_follows',
-    )
+    __slots__ = ()
 
     def __init__(self, frame_type):
         super().__init__(frame_type)
@@ -437,11 +461,7 @@ class RequestStreamFrame(RequestFrame, FrameFragmentMixin):
 
 
 class RequestChannelFrame(RequestFrame, FrameFragmentMixin):
-    __slots__ = (
-        'initial_request_n',
-        'flags_complete',
-        'flags_follows',
-    )
+    __slots__ = 'initial_request_n'
 
     def __init__(self):
         super().__init__(FrameType.REQUEST_CHANNEL)
@@ -487,6 +507,7 @@ class RequestNFrame(RequestFrame):
 
 
 class CancelFrame(Frame):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(FrameType.CANCEL)
@@ -496,17 +517,28 @@ class CancelFrame(Frame):
 
 
 class PayloadFrame(Frame, FrameFragmentMixin):
-    __slots__ = (
-        'flags_follows',
-        'flags_complete',
-        'flags_next'
-    )
+    __slots__ = 'flags_next'
 
     def __init__(self):
         super().__init__(FrameType.PAYLOAD)
+        self.flags_next = False
+
+    def reset(self):
+        self.length = 0
+        self.stream_id = CONNECTION_STREAM_ID
+        self.metadata = b''
+        self.data = b''
+
+        self.flags_ignore = False
+        self.flags_metadata = False
         self.flags_follows = False
         self.flags_complete = False
         self.flags_next = False
+        self.metadata_only = False
+
+        self.fragment_size_bytes = None
+        self.fragment_generator = None
+        self.sent_future = None
 
     def parse(self, buffer, offset):
         flags = parse_header(self, buffer, offset)
@@ -518,6 +550,21 @@ class PayloadFrame(Frame, FrameFragmentMixin):
         offset += self.parse_data(buffer, offset)
 
     def serialize(self, middle=b'', flags=0):
+        return Frame.serialize(self, flags=self._payload_flags(flags))
+
+    def serialize_buffers(self) -> List[Union[bytes, memoryview]]:
+        if self.is_plain_chunk():
+            self.length = HEADER_LENGTH + safe_len(self.data)
+            return serialize_payload_chunk(self.stream_id, self.data, self.flags_complete, self.flags_next,
+                                           length_header=False)
+
+        return self._serialize_buffers(flags=self._payload_flags(0))
+
+    def is_plain_chunk(self) -> bool:
+        # Data only frames, such as file chunks, can use the cached header templates.
+        return not self.metadata and not self.flags_ignore and not self.flags_follows
+
+    def _payload_flags(self, flags: int) -> int:
         flags &= ~(_FLAG_FOLLOWS_BIT | _FLAG_COMPLETE_BIT |
                    _FLAG_NEXT_BIT)
 
@@ -533,7 +580,174 @@ class PayloadFrame(Frame, FrameFragmentMixin):
         if self.flags_next:
             flags |= _FLAG_NEXT_BIT
 
-        return Frame.serialize(self, flags=flags)
+        return flags
+
+
+# Freelist of PayloadFrame instances. A frame must only be released once it
+# has been written by the transport or consumed by its stream handler.
+class PayloadFramePool:
+    __slots__ = (
+        '_free',
+        'max_size',
+        'allocated',
+        'reused',
+        'released'
+    )
+
+    def __init__(self, max_size: int = PAYLOAD_FRAME_POOL_SIZE):
+        self._free: List[PayloadFrame] = []
+        self.max_size = max_size
+        self.allocated = 0
+        self.reused = 0
+        self.released = 0
+
+    def acquire(self) -> PayloadFrame:
+        if self._free:
+            self.reused += 1
+            return self._free.pop()
+
+        self.allocated += 1
+        return PayloadFrame()
+
+    def release(self, frame: Frame):
+        if type(frame) is not PayloadFrame:
+            return
+
+        self.released += 1
+
+        if len(self._free) < self.max_size:
+            frame.reset()
+            self._free.append(frame)
+
+    def stats(self) -> dict:
+        return {
+            'allocated': self.allocated,
+            'reused': self.reused,
+            'released': self.released,
+            'free': len(self._free)
+        }
+
+
+payload_frame_pool = PayloadFramePool()
+
+
+# Opt-in frame layer instrumentation. Counters are lists indexed by frame type
+# id and are only touched from the event loop, so they need no locking. Every
+# sample_every parse or serialize call is timed into a histogram whose bucket
+# k counts durations below 2^k nanoseconds.
+class FrameMetrics:
+    __slots__ = (
+        'enabled',
+        'sample_every',
+        'frames_in',
+        'frames_out',
+        'bytes_in',
+        'bytes_out',
+        'fragments_in',
+        'fragments_out',
+        'ignored',
+        'parse_failures',
+        'parse_ns',
+        'serialize_ns',
+        '_parse_calls',
+        '_serialize_calls'
+    )
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_every = FRAME_METRICS_SAMPLE_EVERY
+        self.reset()
+
+    def enable(self, sample_every: int = FRAME_METRICS_SAMPLE_EVERY):
+        self.sample_every = max(1, sample_every)
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.frames_in = [0] * 64
+        self.frames_out = [0] * 64
+        self.bytes_in = [0] * 64
+        self.bytes_out = [0] * 64
+        self.fragments_in = [0] * 64
+        self.fragments_out = [0] * 64
+        self.ignored = [0] * 64
+        self.parse_failures = [0] * 64
+        self.parse_ns = [0] * FRAME_METRICS_HISTOGRAM_BUCKETS
+        self.serialize_ns = [0] * FRAME_METRICS_HISTOGRAM_BUCKETS
+        self._parse_calls = 0
+        self._serialize_calls = 0
+
+    def sample_parse(self) -> bool:
+        self._parse_calls += 1
+        return self._parse_calls % self.sample_every == 0
+
+    def record_parse_time(self, elapsed_ns: int):
+        self.parse_ns[min(elapsed_ns.bit_length(), FRAME_METRICS_HISTOGRAM_BUCKETS - 1)] += 1
+
+    def record_in(self, frame: Frame):
+        self.frames_in[frame.frame_type] += 1
+        self.bytes_in[frame.frame_type] += frame.length
+
+        if frame.flags_follows:
+            self.fragments_in[frame.frame_type] += 1
+
+    def measure_serialize(self,
+                          frame: Frame,
+                          serialize: Callable[[Frame], List[Union[bytes, memoryview]]]
+                          ) -> List[Union[bytes, memoryview]]:
+        self._serialize_calls += 1
+
+        if self._serialize_calls % self.sample_every == 0:
+            started = perf_counter_ns()
+            buffers = serialize(frame)
+            elapsed_ns = perf_counter_ns() - started
+            self.serialize_ns[min(elapsed_ns.bit_length(), FRAME_METRICS_HISTOGRAM_BUCKETS - 1)] += 1
+        else:
+            buffers = serialize(frame)
+
+        frame_type = frame_type_entry(frame.frame_type)
+
+        if frame_type is not None:
+            self.frames_out[frame_type.frame_type] += 1
+            self.bytes_out[frame_type.frame_type] += frame.length
+
+            if frame.flags_follows:
+                self.fragments_out[frame_type.frame_type] += 1
+
+        return buffers
+
+    def snapshot(self) -> dict:
+        def by_type(counters: List[int]) -> dict:
+            return {_frame_type_name(frame_type): count
+                    for frame_type, count in enumerate(counters) if count}
+
+        def histogram(buckets: List[int]) -> dict:
+            return {2 ** bucket: count for bucket, count in enumerate(buckets) if count}
+
+        return {
+            'enabled': self.enabled,
+            'sample_every': self.sample_every,
+            'frames_in': by_type(self.frames_in),
+            'frames_out': by_type(self.frames_out),
+            'bytes_in': by_type(self.bytes_in),
+            'bytes_out': by_type(self.bytes_out),
+            'fragments_in': by_type(self.fragments_in),
+            'fragments_out': by_type(self.fragments_out),
+            'ignored': by_type(self.ignored),
+            'parse_failures': by_type(self.parse_failures),
+            'parse_ns_below': histogram(self.parse_ns),
+            'serialize_ns_below': histogram(self.serialize_ns)
+        }
+
+
+def _frame_type_name(frame_type: int) -> str:
+    entry = frame_type_entry(frame_type)
+    return entry.frame_type.name if entry is not None else str(frame_type)
+
+
+frame_metrics = FrameMetrics()
 
 
 class MetadataPushFrame(Frame):
@@ -651,23 +865,59 @@ _frame_class_by_id = {
 }
 
 
-def parse_or_ignore(buffer: bytes) -> Optional[Frame]:
+# With zero_copy set, the data and metadata of a PAYLOAD frame are memoryviews
+# into the given buffer rather than copies. Fragments are copied once, when the
+# fragment cache appends them to the frame being reassembled. The caller must
+# not write to that buffer while such a frame is alive. A consumer which keeps
+# the data after handling the frame, or needs a bytes method on it (decode,
+# json), has to copy it with bytes() first. All other frames are parsed from
+# a bytes copy of the buffer.
+def parse_or_ignore(buffer: Union[bytes, memoryview], zero_copy: bool = False) -> Optional[Frame]:
     if len(buffer) < HEADER_LENGTH:
         raise ParseError('Frame too short: {} bytes'.format(len(buffer)))
 
-    header = Header()
-    parse_header(header, buffer, 0)
+    # Only the type and flags are peeked here, the frame parses its own header.
+    frame_type_id = buffer[4] >> 2
+    flags = ((buffer[4] & 3) << 8) | buffer[5]
+    entry = _frame_type_table[frame_type_id]
+
+    if entry is None:
+        if unpack_32bit(buffer, 0) == CONNECTION_STREAM_ID:
+            raise RSocketUnknownFrameType(frame_type_id)
+        entry = _frame_type_table[FrameType.PAYLOAD]
 
-    frame = _frame_class_by_id[header.frame_type]()
+    if zero_copy and entry.frame_type == FrameType.PAYLOAD:
+        buffer = memoryview(buffer)
+    else:
+        buffer = bytes(buffer)
+
+    if entry.frame_type == FrameType.PAYLOAD:
+        frame = payload_frame_pool.acquire()
+    else:
+        frame = entry.frame_class()
 
     try:
-        frame.parse(buffer, 0)
+        if frame_metrics.enabled and frame_metrics.sample_parse():
+            started = perf_counter_ns()
+            entry.parse(frame, buffer, 0)
+            frame_metrics.record_parse_time(perf_counter_ns() - started)
+        else:
+            entry.parse(frame, buffer, 0)
 
         if not is_frame_to_ignore(frame):
+            if frame_metrics.enabled:
+                frame_metrics.record_in(frame)
+
             return frame
 
+        if frame_metrics.enabled:
+            frame_metrics.ignored[entry.frame_type] += 1
+
     except Exception as exception:
-        if not header.flags_ignore:
+        if frame_metrics.enabled:
+            frame_metrics.parse_failures[entry.frame_type] += 1
+
+        if not is_flag_set(flags, _FLAG_IGNORE_BIT):
             # import pdb; pdb.set_trace()
             logger().debug(exception)
             pass
@@ -675,7 +925,7 @@ def parse_or_ignore(buffer: bytes) -> Optional[Frame]:
 
 
 def is_frame_to_ignore(frame: Frame) -> bool:
-    if isinstance(frame, MetadataPushFrame) and frame.stream_id != CONNECTION_STREAM_ID:
+    if frame.frame_type == FrameType.METADATA_PUSH and frame.stream_id != CONNECTION_STREAM_ID:
         logger().error('Invalid metadata frame')
         return True
 
@@ -683,13 +933,8 @@ def is_frame_to_ignore(frame: Frame) -> bool:
 
 
 def is_fragmentable_frame(frame: Frame) -> bool:
-    return isinstance(frame, (
-        PayloadFrame,
-        RequestResponseFrame,
-        RequestChannelFrame,
-        RequestStreamFrame,
-        RequestFireAndForgetFrame
-    ))
+    entry = frame_type_entry(frame.frame_type)
+    return entry is not None and entry.fragmentable
 
 
 FragmentableFrame = Union[PayloadFrame,
@@ -701,11 +946,16 @@ FragmentableFrame = Union[PayloadFrame,
 
 def new_frame_fragment(base_frame: FragmentableFrame, fragment: Fragment) -> Frame:
     if fragment.is_first:
-        frame = base_frame.__class__()
+        entry = _frame_type_table[base_frame.frame_type]
+    else:
+        entry = _frame_type_table[FrameType.PAYLOAD]
+
+    if entry.frame_type == FrameType.PAYLOAD:
+        frame = payload_frame_pool.acquire()
     else:
-        frame = PayloadFrame()
+        frame = entry.frame_class()
 
-    if isinstance(frame, PayloadFrame):
+    if entry.frame_type == FrameType.PAYLOAD:
         if not is_blank(frame.data) or not is_blank(frame.metadata):
             frame.flags_next = True
 
@@ -750,11 +1000,76 @@ def error_frame_to_exception(frame: ErrorFrame) -> Exception:
     return RuntimeError(frame.data.decode('utf-8'))
 
 
+def ensure_owned(value: Optional[Union[bytes, memoryview]]) -> Optional[bytes]:
+    if isinstance(value, memoryview):
+        return bytes(value)
+
+    return value
+
+
 def serialize_with_frame_size_header(frame: Frame) -> bytes:
-    serialized_frame = frame.serialize()
-    header = struct.pack('>I', len(serialized_frame))[1:]
-    full_frame = header + serialized_frame
-    return full_frame
+    return b''.join(serialize_buffers_with_frame_size_header(frame))
+
+
+def serialize_buffers_with_frame_size_header(frame: Frame) -> List[Union[bytes, memoryview]]:
+    if frame_metrics.enabled:
+        return frame_metrics.measure_serialize(frame, _buffers_with_frame_size_header)
+
+    return _buffers_with_frame_size_header(frame)
+
+
+def serialize_frame_buffers(frame: Frame) -> List[Union[bytes, memoryview]]:
+    # For transports which delimit frames themselves and need no frame size header.
+    if frame_metrics.enabled:
+        return frame_metrics.measure_serialize(frame, _frame_buffers)
+
+    return frame.serialize_buffers()
+
+
+def _frame_buffers(frame: Frame) -> List[Union[bytes, memoryview]]:
+    return frame.serialize_buffers()
+
+
+def _buffers_with_frame_size_header(frame: Frame) -> List[Union[bytes, memoryview]]:
+    if type(frame) is PayloadFrame and frame.is_plain_chunk():
+        frame.length = HEADER_LENGTH + safe_len(frame.data)
+        return serialize_payload_chunk(frame.stream_id, frame.data, frame.flags_complete, frame.flags_next)
+
+    buffers = frame.serialize_buffers()
+    length = sum(len(buffer) for buffer in buffers)
+    buffers[0] = pack_24bit(length) + buffers[0]
+    return buffers
+
+
+@lru_cache(maxsize=256)
+def payload_header_template(stream_id: int, flags: int) -> bytes:
+    return struct.pack('>IBB', stream_id, (FrameType.PAYLOAD << 2) | (flags >> 8), flags & 0xff)
+
+
+def serialize_payload_chunk(stream_id: int,
+                            data: Union[bytes, memoryview],
+                            complete: bool = False,
+                            is_next: bool = True,
+                            length_header: bool = True) -> List[Union[bytes, memoryview]]:
+    # Serializes a data only PAYLOAD frame as the header and a view of the data.
+    # Only the frame size header changes between chunks of the same stream.
+    flags = 0
+
+    if complete:
+        flags |= _FLAG_COMPLETE_BIT
+
+    if is_next or data:
+        flags |= _FLAG_NEXT_BIT
+
+    header = payload_header_template(stream_id, flags)
+
+    if length_header:
+        header = (HEADER_LENGTH + safe_len(data)).to_bytes(3, 'big') + header
+
+    if data:
+        return [header, memoryview(data)]
+
+    return [header]
 
 
 initiate_request_frame_types = (RequestResponseFrame,
@@ -773,4 +1088,33 @@ frame_header_length = {
 
 
 def get_header_length(frame: FragmentableFrame) -> int:
-    return frame_header_length[frame.__class__]
+    return _frame_type_table[frame.frame_type].header_length
+
+
+class FrameTypeEntry(NamedTuple):
+    frame_type: FrameType
+    frame_class: Type[Frame]
+    header_length: int
+    fragmentable: bool
+    parse: Callable[[Frame, bytes, int], None]
+
+
+# Indexed by the 6 bit frame type id of the frame header.
+_frame_type_table: List[Optional[FrameTypeEntry]] = [None] * 64
+
+for _frame_type, _frame_class in _frame_class_by_id.items():
+    _frame_type_table[_frame_type] = FrameTypeEntry(
+        _frame_type,
+        _frame_class,
+        frame_header_length.get(_frame_class, HEADER_LENGTH),
+        _frame_class in frame_header_length,
+        _frame_class.parse
+    )
+
+
+def frame_type_entry(frame_type: int) -> Optional[FrameTypeEntry]:
+    if 0 <= frame_type < len(_frame_type_table):
+        return _frame_type_table[frame_type]
+
+    return None
+
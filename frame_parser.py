@@ -0,0 +1,87 @@
+from typing import AsyncGenerator, Generator
+
+from rsocket.logger import logger
+
+__all__ = ['FrameParser']
+
+from rsocket.frame import Frame, InvalidFrame, parse_or_ignore
+
+
+class FrameParser:
+    def __init__(self):
+        # Holds the bytes of at most one incomplete frame between reads.
+        self._buffer = bytearray()
+
+    async def receive_data(self, data: bytes, header_length=3) -> AsyncGenerator[Frame, None]:
+        for frame in self.frames(data, header_length):
+            yield frame
+
+    def frames(self, data: bytes, header_length=3) -> Generator[Frame, None, None]:
+        view = memoryview(data)
+
+        if header_length == 0:
+            yield from self._parse(view)
+            return
+
+        if self._buffer:
+            # Complete the pending frame from the head of the read. The rest of
+            # the read is parsed in place below.
+            consumed = self._fill_buffer(view, header_length)
+            view = view[consumed:]
+
+            if len(self._buffer) != self._buffered_frame_end(header_length):
+                return
+
+            # Frames parsed from the buffer may hold views into it, so it is
+            # replaced rather than cleared.
+            buffered = memoryview(self._buffer)[header_length:]
+            self._buffer = bytearray()
+            yield from self._parse(buffered)
+
+        offset = 0
+        total = len(view)
+
+        while total - offset >= header_length:
+            length = int.from_bytes(view[offset:offset + header_length], 'big')
+            end = offset + header_length + length
+
+            if end > total:
+                break
+
+            yield from self._parse(view[offset + header_length:end])
+            offset = end
+
+        if offset < total:
+            self._buffer += view[offset:]
+
+    def _fill_buffer(self, view: memoryview, header_length: int) -> int:
+        consumed = 0
+
+        while consumed < len(view):
+            needed = self._buffered_frame_end(header_length) - len(self._buffer)
+
+            if needed == 0:
+                break
+
+            chunk = view[consumed:consumed + needed]
+            self._buffer += chunk
+            consumed += len(chunk)
+
+        return consumed
+
+    def _buffered_frame_end(self, header_length: int) -> int:
+        if len(self._buffer) < header_length:
+            return header_length
+
+        return header_length + int.from_bytes(self._buffer[:header_length], 'big')
+
+    # noinspection PyMethodMayBeStatic
+    def _parse(self, buffer: memoryview) -> Generator[Frame, None, None]:
+        try:
+            new_frame = parse_or_ignore(buffer, zero_copy=True)
+
+            if new_frame is not None:
+                yield new_frame
+        except Exception:
+            logger().error('Error parsing frame', exc_info=True)
+            yield InvalidFrame()
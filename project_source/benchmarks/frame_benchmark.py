@@ -0,0 +1,340 @@
+#
+# frame_benchmark.py
+#
+# PURPOSE: Microbenchmarks for the patched RSocket frame layer.
+# Measures frames and bytes per second for encoding, decoding and
+# fragmenting payload frames at several payload sizes, plus the TCP
+# transport path, and prints the results as JSON so runs can be
+# compared between commits. Run from the repository root with
+# python -m project_source.benchmarks.frame_benchmark [output.json]
+#
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List
+
+from rsocket.frame import parse_or_ignore, serialize_with_frame_size_header, \
+    serialize_buffers_with_frame_size_header, payload_frame_pool
+from rsocket.frame_builders import to_payload_frame
+from rsocket.frame_fragment_cache import FrameFragmentCache
+from rsocket.frame_parser import FrameParser
+from rsocket.payload import Payload
+from rsocket.transports.tcp import TransportTCP
+
+PAYLOAD_SIZES = [64, 256, 2 * 1024, 64 * 1024, 1024 * 1024]
+# Each measurement processes about this many payload bytes, within the frame count limits.
+BYTES_PER_RUN = 32 * 1024 * 1024
+MIN_FRAMES = 50
+MAX_FRAMES = 100000
+REPEATS = 5
+READ_SIZE = 64 * 1024
+FRAGMENT_SIZE = 16 * 1024
+TRANSPORT_PAYLOAD_SIZE = 256
+
+#
+# frame_count
+#
+# PURPOSE: Picks how many frames one measurement processes.
+# PARAMS:
+#   size: The number of data bytes in each frame.
+#   bytes_per_run: The number of payload bytes to process.
+# RETURN/SIDE EFFECTS: The number of frames.
+# NOTES: N/A
+#
+def frame_count(size: int, bytes_per_run: int = BYTES_PER_RUN) -> int:
+    return max(MIN_FRAMES, min(MAX_FRAMES, bytes_per_run // size))
+
+#
+# new_chunk_frame
+#
+# PURPOSE: Builds a data only payload frame like a file chunk.
+# PARAMS:
+#   size: The number of data bytes in the frame.
+#   fragment_size: The fragment size of the frame, if any.
+# RETURN/SIDE EFFECTS: The frame.
+# NOTES: N/A
+#
+def new_chunk_frame(size: int, fragment_size: int = None):
+    return to_payload_frame(1, Payload(bytes(size)), fragment_size_bytes=fragment_size)
+
+#
+# bench_serialize
+#
+# PURPOSE: Times Frame.serialize, which joins the frame into one bytes object.
+# PARAMS:
+#   count: The number of frames to serialize.
+#   size: The number of data bytes in each frame.
+# RETURN/SIDE EFFECTS: The elapsed time in seconds.
+# NOTES: N/A
+#
+def bench_serialize(count: int, size: int) -> float:
+    frame = new_chunk_frame(size)
+    start = time.perf_counter()
+    for _ in range(count):
+        frame.serialize()
+    return time.perf_counter() - start
+
+#
+# bench_serialize_with_frame_size_header
+#
+# PURPOSE: Times serialize_with_frame_size_header, as used for TCP.
+# PARAMS:
+#   count: The number of frames to serialize.
+#   size: The number of data bytes in each frame.
+# RETURN/SIDE EFFECTS: The elapsed time in seconds.
+# NOTES: N/A
+#
+def bench_serialize_with_frame_size_header(count: int, size: int) -> float:
+    frame = new_chunk_frame(size)
+    start = time.perf_counter()
+    for _ in range(count):
+        serialize_with_frame_size_header(frame)
+    return time.perf_counter() - start
+
+#
+# bench_serialize_buffers
+#
+# PURPOSE: Times serialize_buffers_with_frame_size_header, which is
+# what the TCP transport writes without joining the frame.
+# PARAMS:
+#   count: The number of frames to serialize.
+#   size: The number of data bytes in each frame.
+# RETURN/SIDE EFFECTS: The elapsed time in seconds.
+# NOTES: N/A
+#
+def bench_serialize_buffers(count: int, size: int) -> float:
+    frame = new_chunk_frame(size)
+    start = time.perf_counter()
+    for _ in range(count):
+        serialize_buffers_with_frame_size_header(frame)
+    return time.perf_counter() - start
+
+#
+# bench_parse
+#
+# PURPOSE: Times parse_or_ignore as the frame parser calls it,
+# returning each frame to the pool once it is consumed.
+# PARAMS:
+#   count: The number of frames to decode.
+#   size: The number of data bytes in each frame.
+# RETURN/SIDE EFFECTS: The elapsed time in seconds.
+# NOTES: N/A
+#
+def bench_parse(count: int, size: int) -> float:
+    raw = memoryview(serialize_with_frame_size_header(new_chunk_frame(size)))[3:]
+    start = time.perf_counter()
+    for _ in range(count):
+        payload_frame_pool.release(parse_or_ignore(raw, zero_copy=True))
+    return time.perf_counter() - start
+
+#
+# bench_fragmentation
+#
+# PURPOSE: Times fragmenting payloads at FRAGMENT_SIZE, serializing
+# the fragments and reassembling them as the receiving side does.
+# PARAMS:
+#   count: The number of payloads to fragment.
+#   size: The number of data bytes in each payload.
+# RETURN/SIDE EFFECTS: The elapsed time in seconds.
+# NOTES: Payloads smaller than FRAGMENT_SIZE are sent as one frame.
+#
+def bench_fragmentation(count: int, size: int) -> float:
+    payload = Payload(bytes(size))
+    cache = FrameFragmentCache()
+    start = time.perf_counter()
+    for _ in range(count):
+        frame = to_payload_frame(1, payload, fragment_size_bytes=FRAGMENT_SIZE)
+        while True:
+            fragment = frame.get_next_fragment()
+            raw = b''.join(serialize_buffers_with_frame_size_header(fragment))
+            if cache.append(parse_or_ignore(raw[3:], zero_copy=True)) is not None:
+                break
+    return time.perf_counter() - start
+
+#
+# bench_receive
+#
+# PURPOSE: Times the frame parser over a stream of frames read in
+# READ_SIZE pieces, as the TCP transport receives them.
+# PARAMS:
+#   count: The number of frames in the stream.
+#   size: The number of data bytes in each frame.
+# RETURN/SIDE EFFECTS: The elapsed time in seconds.
+# NOTES: N/A
+#
+def bench_receive(count: int, size: int) -> float:
+    stream = serialize_with_frame_size_header(new_chunk_frame(size)) * count
+
+    async def receive() -> float:
+        parser = FrameParser()
+        start = time.perf_counter()
+        for offset in range(0, len(stream), READ_SIZE):
+            async for _ in parser.receive_data(stream[offset:offset + READ_SIZE]):
+                pass
+        return time.perf_counter() - start
+
+    return asyncio.run(receive())
+
+#
+# bench_tcp_send
+#
+# PURPOSE: Times sending chunks through the TCP transport to a local
+# server that discards them, as a download stream would.
+# PARAMS:
+#   count: The number of chunks to send.
+#   size: The number of data bytes in each chunk.
+# RETURN/SIDE EFFECTS: The elapsed time in seconds.
+# NOTES: N/A
+#
+def bench_tcp_send(count: int, size: int) -> float:
+    expected = len(serialize_with_frame_size_header(new_chunk_frame(size))) * count
+
+    async def send() -> float:
+        received = asyncio.Event()
+
+        async def discard(reader, writer):
+            total = 0
+            while total < expected:
+                data = await reader.read(READ_SIZE)
+                if not data:
+                    break
+                total += len(data)
+            received.set()
+            writer.close()
+
+        server = await asyncio.start_server(discard, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        transport = TransportTCP(*await asyncio.open_connection('127.0.0.1', port))
+        payload = Payload(bytes(size))
+
+        start = time.perf_counter()
+        for _ in range(count):
+            await transport.send_frame(to_payload_frame(1, payload))
+        await transport.on_send_queue_empty()
+        await received.wait()
+        elapsed = time.perf_counter() - start
+
+        await transport.close()
+        server.close()
+        await server.wait_closed()
+        return elapsed
+
+    return asyncio.run(send())
+
+#
+# count_stream_allocations
+#
+# PURPOSE: Sends and receives chunks the way a channel stream does,
+# returning each frame to the pool once it has been written or consumed.
+# PARAMS:
+#   count: The number of chunks to stream.
+#   size: The number of data bytes in each chunk.
+# RETURN/SIDE EFFECTS: The number of frames allocated after the first chunk.
+# NOTES: N/A
+#
+def count_stream_allocations(count: int, size: int) -> int:
+    payload = Payload(bytes(size))
+    allocated = None
+    for _ in range(count):
+        frame = to_payload_frame(1, payload)
+        sent = frame.get_next_fragment()
+        frame.get_next_fragment()
+        raw = b''.join(serialize_buffers_with_frame_size_header(sent))
+        payload_frame_pool.release(sent)
+        payload_frame_pool.release(parse_or_ignore(raw[3:], zero_copy=True))
+        if allocated is None:
+            allocated = payload_frame_pool.allocated
+    return payload_frame_pool.allocated - allocated
+
+#
+# measure
+#
+# PURPOSE: Runs a benchmark REPEATS times and keeps the fastest run.
+# PARAMS:
+#   bench: The benchmark, taking a frame count and payload size.
+#   size: The number of data bytes in each frame.
+#   bytes_per_run: The number of payload bytes to process per run.
+#   repeats: The number of runs.
+# RETURN/SIDE EFFECTS: The frame count and frames and payload bytes per second.
+# NOTES: N/A
+#
+def measure(bench: Callable[[int, int], float],
+            size: int,
+            bytes_per_run: int = BYTES_PER_RUN,
+            repeats: int = REPEATS) -> Dict[str, float]:
+    count = frame_count(size, bytes_per_run)
+    elapsed = min(bench(count, size) for _ in range(repeats))
+    return {
+        'frames': count,
+        'frames_per_second': round(count / elapsed),
+        'bytes_per_second': round(count * size / elapsed)
+    }
+
+#
+# git_commit
+#
+# PURPOSE: Finds the commit the benchmark is run against.
+# RETURN/SIDE EFFECTS: The commit hash, or None outside a git checkout.
+# NOTES: N/A
+#
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+#
+# run_suite
+#
+# PURPOSE: Runs every frame benchmark at every payload size.
+# PARAMS:
+#   sizes: The payload sizes to measure.
+#   bytes_per_run: The number of payload bytes to process per run.
+#   repeats: The number of runs per measurement.
+# RETURN/SIDE EFFECTS: The results, ready to be written as JSON.
+# NOTES: N/A
+#
+def run_suite(sizes: List[int] = PAYLOAD_SIZES,
+              bytes_per_run: int = BYTES_PER_RUN,
+              repeats: int = REPEATS) -> dict:
+    frame_benchmarks = {
+        'serialize': bench_serialize,
+        'serialize_with_frame_size_header': bench_serialize_with_frame_size_header,
+        'serialize_buffers_with_frame_size_header': bench_serialize_buffers,
+        'parse_or_ignore': bench_parse,
+        'fragmentation': bench_fragmentation,
+        'receive_data': bench_receive
+    }
+    results = {
+        name: {str(size): measure(bench, size, bytes_per_run, repeats) for size in sizes}
+        for name, bench in frame_benchmarks.items()
+    }
+    results['tcp_send'] = {
+        str(TRANSPORT_PAYLOAD_SIZE): measure(bench_tcp_send, TRANSPORT_PAYLOAD_SIZE, bytes_per_run, repeats)
+    }
+
+    return {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'fragment_size': FRAGMENT_SIZE,
+        'frames_allocated_while_streaming': count_stream_allocations(
+            frame_count(TRANSPORT_PAYLOAD_SIZE, bytes_per_run), TRANSPORT_PAYLOAD_SIZE),
+        'results': results
+    }
+
+
+def main():
+    output = json.dumps(run_suite(), indent=2)
+    print(output)
+
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], 'w') as f:
+            f.write(output)
+
+
+if __name__ == '__main__':
+    main()
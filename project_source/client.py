@@ -9,7 +9,8 @@
 import asyncio
 import logging
 import sys
-from project_source.common.constants import DEBUG, MAIN, QUIC, TCP
+from rsocket.frame import frame_metrics
+from project_source.common.constants import DEBUG, MAIN, METRICS, QUIC, TCP
 from project_source.common.messages import MISSING_ARGS
 
 from project_source.client_module.tcp_client import TCPClient
@@ -31,6 +32,10 @@ def main():
     if debug == DEBUG:
         logging.basicConfig(filename="client.log", level=logging.DEBUG)
 
+    # count frames and sample their timing, saved with each experiment.
+    if debug == METRICS:
+        frame_metrics.enable()
+
     client = None
     if type == QUIC:
         client = QUICClient()
@@ -19,9 +19,9 @@ from pathlib import Path
 from typing import Optional
 from reactivestreams.subscription import Subscription
 from reactivestreams.subscriber import DefaultSubscriber
-from reactivestreams.publisher import DefaultPublisher
 from rsocket.payload import Payload
 from project_source.common.constants import BEGIN, CHUNK_CAP, CLIENT_MODULE, FILENAME_TEMPLATE, FILES_DIR, MESSAGE, PROJECT_SRC, SUBSCRIPTION, WRITE_BYTES
+from project_source.common.flow_control import CreditPublisher, CreditWindow
 from project_source.common.helpers import create_payload, parse_byte_payload
 
 from project_source.common.messages import CHUNK_RECEIVED, DOWNLOADING, SENDING_PENDING
@@ -30,9 +30,10 @@ from project_source.common.messages import CHUNK_RECEIVED, DOWNLOADING, SENDING_
 #
 # ClientUploadPublisher
 #
-# PURPOSES: Pushes bytes of a file to the server
+# PURPOSES: Pushes bytes of a file to the server. The
+# server grants credit for the chunks it is ready for.
 #
-class ClientUploadPublisher(DefaultPublisher):
+class ClientUploadPublisher(CreditPublisher):
         def upload_bytes(self, value):
             self._subscriber.on_next(value)
 
@@ -90,7 +91,7 @@ class ClientUploadSubscriber(DefaultSubscriber):
 # PURPOSE: Indicates to the server that we are ready to
 # receive data.
 #
-class ClientDownloadPublisher(DefaultPublisher):
+class ClientDownloadPublisher(CreditPublisher):
     def begin(self, value: Payload):
         self._subscriber.on_next(value)
 
@@ -107,7 +108,8 @@ class ClientDownloadPublisher(DefaultPublisher):
 # ClientDownloadSubscriber
 #
 # PURPOSE: Receives data from the server and stores
-# it in a file.
+# it in a file. Replenishes the server's credit as
+# chunks are written.
 #
 # PARAMS:
 # automated - indicates if the we are running the download
@@ -129,6 +131,8 @@ class ClientDownloadSubscriber(DefaultSubscriber):
         self.complete_event: asyncio.Event = complete_event
         self.filename: str = filename
         self.owner: str = owner
+        # the initial window is granted with the channel request
+        self.credit_window = CreditWindow()
         try:
             # try to open the flie, signal error if one occurs
             root_path = Path(os.getcwd()).resolve().parent
@@ -160,6 +164,8 @@ class ClientDownloadSubscriber(DefaultSubscriber):
                         self.num_chunks = self.num_chunks + 1
                         if self.num_chunks >= CHUNK_CAP:
                             self.on_complete()
+                        else:
+                            self.credit_window.chunk_consumed(self.subscription)
                 except Exception as e:
                     self.on_error(e)
             else:
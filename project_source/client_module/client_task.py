@@ -12,6 +12,7 @@ import os
 from pathlib import Path
 import time
 
+from rsocket.frame import frame_metrics
 from rsocket.rsocket_client import RSocketClient
 from project_source.client_module.client_streams import (
     ClientDownloadPublisher,
@@ -27,13 +28,13 @@ from project_source.common.constants import (
     FILENAME,
     FILES_DIR,
     LARGE_CHUNK,
-    MAX_REQUEST_NUMBER,
     MESSAGE,
     INVALID,
     NUM_TESTS,
     OWNER,
     PROJECT_SRC,
     READ_BYTES,
+    REQUEST_WINDOW,
     SIZE,
     SUBJECT,
     SUCCESS,
@@ -277,7 +278,7 @@ async def upload_file(client: RSocketClient, data):
     chunk_publisher = ClientUploadPublisher()
     channel_subscriber = ClientUploadSubscriber(established, complete)
     channel = client.request_channel(create_payload(data), chunk_publisher, None)
-    channel.initial_request_n(MAX_REQUEST_NUMBER)
+    channel.initial_request_n(REQUEST_WINDOW)
     channel.subscribe(channel_subscriber)
 
     # wait until the server is ready
@@ -287,8 +288,11 @@ async def upload_file(client: RSocketClient, data):
         file = open(file_path, READ_BYTES)
         chunk = file.read(LARGE_CHUNK)
 
-        # send the chunks, stop if the server sends an error
+        # send the chunks as the server grants credit, stop if the server sends an error
         while chunk and channel_subscriber.error == None:
+            await chunk_publisher.wait_for_credit()
+            if not chunk_publisher.take_credit():
+                break
             chunk_publisher.upload_bytes(create_byte_payload(chunk))
             chunk = file.read(LARGE_CHUNK)
 
@@ -331,7 +335,7 @@ async def download_file(client: RSocketClient, data, automated: bool = False) ->
     publisher = ClientDownloadPublisher()
     subscriber = ClientDownloadSubscriber(owner, filename, publisher, complete, automated)
     channel = client.request_channel(create_payload(data), publisher, None)
-    channel.initial_request_n(MAX_REQUEST_NUMBER)
+    channel.initial_request_n(REQUEST_WINDOW)
     channel.subscribe(subscriber)
 
     start_time = time.time()
@@ -442,6 +446,9 @@ async def automate_download(client: RSocketClient, data):
         print(RUNNING_TESTS)
 
         if experiment.error is None:
+            # only count the frames of this experiment
+            frame_metrics.reset()
+
             # run the tests and save the results
             while(tests_done < num_tests):
               bench = await download_file(client, data, True)
@@ -451,6 +458,7 @@ async def automate_download(client: RSocketClient, data):
                   logging.info(TEST_COMPLETED.format(tests_done))
 
             experiment.save_to_csv()
+            experiment.save_frame_metrics()
         else:
             print(AUTOMATE_ERROR)
     except Exception as e:
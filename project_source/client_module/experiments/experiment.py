@@ -6,15 +6,18 @@
 # PURPOSE: Implements an object that stores multiple
 # download benchmarks and writes the results to a csv file.
 #
+import json
 import logging
 import os
 from pathlib import Path
+from rsocket.frame import frame_metrics
 from project_source.client_module.experiments.benchmark import Benchmark
 from project_source.common.constants import (
     CLIENT_MODULE,
     CSV_HEADER,
     CSV_TEMPLATE,
     EXPERIMENT_DIR,
+    FRAME_METRICS_TEMPLATE,
     PROJECT_SRC,
     RESULTS_DIR,
     WRITE_TEXT
@@ -22,7 +25,9 @@ from project_source.common.constants import (
 from project_source.common.messages import (
     EXPERIMENT_ERROR,
     EXPERIMENT_SAVE_ERROR,
-    EXPERIMENT_SAVED
+    EXPERIMENT_SAVED,
+    FRAME_METRICS_SAVE_ERROR,
+    FRAME_METRICS_SAVED
 )
 
 
@@ -31,18 +36,18 @@ class Experiment():
         self.name: str = name
         self.entries = []
         self.error: Exception = None
+        root_path = Path(os.getcwd()).resolve().parent
+        self.results_path = os.path.join(
+            root_path,
+            PROJECT_SRC,
+            CLIENT_MODULE,
+            EXPERIMENT_DIR,
+            RESULTS_DIR
+        )
 
         # open the file writer, indicate if errors occur
         try:
-            root_path = Path(os.getcwd()).resolve().parent
-            file_path = os.path.join(
-                root_path,
-                PROJECT_SRC,
-                CLIENT_MODULE,
-                EXPERIMENT_DIR,
-                RESULTS_DIR,
-                CSV_TEMPLATE.format(self.name)
-            )
+            file_path = os.path.join(self.results_path, CSV_TEMPLATE.format(self.name))
             self.file_writer = open(file_path, WRITE_TEXT)
         except OSError as ose:
             print(EXPERIMENT_ERROR)
@@ -79,3 +84,21 @@ class Experiment():
                 self.error = e
             finally:
                 self.file_writer.close()
+
+
+    #
+    # save_frame_metrics
+    #
+    # PURPOSE: Writes a snapshot of the frame layer metrics to a
+    # JSON file next to the CSV, if the metrics were enabled.
+    #
+    def save_frame_metrics(self):
+        if self.error == None and frame_metrics.enabled:
+            try:
+                file_path = os.path.join(self.results_path, FRAME_METRICS_TEMPLATE.format(self.name))
+                with open(file_path, WRITE_TEXT) as metrics_writer:
+                    json.dump(frame_metrics.snapshot(), metrics_writer, indent=2)
+                print(FRAME_METRICS_SAVED)
+            except Exception as e:
+                print(FRAME_METRICS_SAVE_ERROR)
+                logging.error(e)
@@ -21,6 +21,7 @@ EXPERIMENT_DIR="experiments"
 FILENAME="filename"
 FILENAME_TEMPLATE="{}_{}"
 FILES_DIR="files"
+FRAME_METRICS_TEMPLATE="{}_frames.json"
 LOCALHOST="localhost"
 INVALID="invalid"
 LARGE="large"
@@ -32,7 +33,8 @@ OWNER="owner"
 PROJECT_SRC="project_source"
 READ_BYTES="rb"
 RESULTS_DIR="saved"
-MAX_REQUEST_NUMBER=100000
+REQUEST_WINDOW=128
+METRICS="metrics"
 NUM_TESTS="NUM_TESTS"
 SERVER_MODULE="server_module"
 SIZE="SIZE"
@@ -0,0 +1,116 @@
+#
+# flow_control.py
+#
+# PURPOSE: Implements credit based flow control for the
+# file transfer channels. The side receiving a file grants
+# credit for a window of chunks through REQUEST_N frames and
+# replenishes it as chunks are written, and the side sending
+# the file only sends a chunk while it holds credit. This keeps
+# the number of chunks in flight bounded per channel.
+#
+import asyncio
+from typing import Callable, Optional
+from reactivestreams.publisher import DefaultPublisher
+from reactivestreams.subscriber import Subscriber
+from reactivestreams.subscription import Subscription
+from project_source.common.constants import REQUEST_WINDOW
+
+
+#
+# CreditPublisher
+#
+# PURPOSE: A publisher that is also the subscription of the
+# RSocket stream it publishes to, so REQUEST_N frames received
+# from the other host are added to its credit.
+#
+class CreditPublisher(DefaultPublisher, Subscription):
+    def __init__(self):
+        self.credit: int = 0
+        self.cancelled: bool = False
+        # called whenever credit is granted, used to resume sending
+        self.on_credit: Optional[Callable[[], None]] = None
+        self.credit_available = asyncio.Event()
+
+
+    def subscribe(self, subscriber: Subscriber):
+        super().subscribe(subscriber)
+        subscriber.on_subscribe(self)
+
+
+    def request(self, n: int):
+        self.credit += n
+        self.credit_available.set()
+        if self.on_credit is not None:
+            self.on_credit()
+
+
+    def cancel(self):
+        self.cancelled = True
+        self.credit = 0
+        self.credit_available.set()
+
+
+    #
+    # take_credit
+    #
+    # PURPOSE: Uses one credit to send a chunk.
+    #
+    # Returns False if there is no credit left.
+    #
+    def take_credit(self) -> bool:
+        if self.credit <= 0:
+            self.credit_available.clear()
+            return False
+        self.credit -= 1
+        return True
+
+
+    #
+    # wait_for_credit
+    #
+    # PURPOSE: Waits until the other host grants credit
+    # or cancels the stream.
+    #
+    async def wait_for_credit(self):
+        while self.credit <= 0 and not self.cancelled:
+            self.credit_available.clear()
+            await self.credit_available.wait()
+
+
+#
+# CreditWindow
+#
+# PURPOSE: Tracks the credit granted by the receiving side
+# of a channel and replenishes it once half of the window has
+# been consumed.
+#
+# PARAMS:
+# window - the number of chunks that may be in flight
+#
+class CreditWindow():
+    def __init__(self, window: int = REQUEST_WINDOW):
+        self.window = window
+        self.consumed = 0
+
+
+    #
+    # open
+    #
+    # PURPOSE: Grants the initial window to the sender.
+    #
+    def open(self, subscription: Optional[Subscription]):
+        if subscription is not None:
+            subscription.request(self.window)
+
+
+    #
+    # chunk_consumed
+    #
+    # PURPOSE: Records that a chunk was written and grants
+    # more credit once half of the window is used.
+    #
+    def chunk_consumed(self, subscription: Optional[Subscription]):
+        self.consumed = self.consumed + 1
+        if self.consumed >= max(1, self.window // 2) and subscription is not None:
+            subscription.request(self.consumed)
+            self.consumed = 0
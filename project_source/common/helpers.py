@@ -7,7 +7,7 @@
 # Python data into data that can be sent via RSocket.
 #
 import json
-from typing import Any
+from typing import Any, Union
 from rsocket.payload import Payload
 
 from project_source.common.constants import ENCODE_TYPE
@@ -54,9 +54,11 @@ def parse_payload(payload: Payload) -> Any:
 # PARAMS:
 # payload - The payload from an RSocket message.
 #
-# Returns raw byte data.
+# Returns raw byte data. File chunks received over a channel
+# are memoryviews into the receive buffer, so copy them with
+# bytes() if they need to be kept after the chunk is handled.
 #
-def parse_byte_payload(payload: Payload) -> bytes:
+def parse_byte_payload(payload: Payload) -> Union[bytes, memoryview]:
     return payload.data
 
 
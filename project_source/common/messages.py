@@ -24,6 +24,8 @@ EMPTY=""
 EXPERIMENT_ERROR="Failed to open a file to store the test. See the debug logs for the error."
 EXPERIMENT_SAVE_ERROR="An error occurred while saving the experiment data. See the debug logs."
 EXPERIMENT_SAVED="Successfully saved the experiment data in a csv."
+FRAME_METRICS_SAVED="Saved the frame metrics for the experiment."
+FRAME_METRICS_SAVE_ERROR="An error occurred while saving the frame metrics. See the debug logs."
 FILE="Filename: {}, Owner: {}\n"
 FILE_CREATED="\nFile {} created successfully."
 FILE_DOWNLOADED="\nFile {} downloaded successfully."
@@ -19,7 +19,6 @@ from pathlib import Path
 from typing import Optional
 from reactivestreams.subscription import Subscription
 from reactivestreams.subscriber import DefaultSubscriber
-from reactivestreams.publisher import DefaultPublisher
 from project_source.common.constants import (
     COMPLETE,
     ENCODE_TYPE,
@@ -30,6 +29,7 @@ from project_source.common.constants import (
     SERVER_MODULE,
     WRITE_BYTES
 )
+from project_source.common.flow_control import CreditPublisher, CreditWindow
 from project_source.common.helpers import create_byte_payload, parse_byte_payload, parse_payload
 
 from project_source.common.messages import (
@@ -49,7 +49,7 @@ class AccessDeniedException(Exception):
 
 
 # For communicating with the client who is sending the file.
-class ServerUploadPublisher(DefaultPublisher):
+class ServerUploadPublisher(CreditPublisher):
     def complete(self):
         self._subscriber.on_complete()
 
@@ -62,7 +62,8 @@ class ServerUploadPublisher(DefaultPublisher):
 # ServerUploadSubscriber
 #
 # PURPOSE: Receives data from the client and stores
-# it in a file.
+# it in a file. Grants the client credit for a window
+# of chunks and replenishes it as chunks are written.
 #
 # PARAMS:
 # username - owner of the file
@@ -80,6 +81,7 @@ class ServerUploadSubscriber(DefaultSubscriber):
         self.subscription: Optional[Subscription] = None
         self.publisher: ServerUploadPublisher = publisher
         self.file_service : FileService = file_service
+        self.credit_window = CreditWindow()
         # make sure the we can record the file in the database
         try:
             self.file_service.create_file(self.owner, self.filename)
@@ -105,6 +107,7 @@ class ServerUploadSubscriber(DefaultSubscriber):
                 data = parse_byte_payload(value)
                 logging.info(CHUNK_RECEIVED.format(data))
                 self.file_writer.write(data)
+                self.credit_window.chunk_consumed(self.subscription)
             except Exception as e:
                 self.on_error(e)
         else:
@@ -124,8 +127,10 @@ class ServerUploadSubscriber(DefaultSubscriber):
         self.publisher.error(RuntimeError(message))
 
 
+    # lets the client start sending chunks
     def on_subscribe(self, subscription: Subscription):
         self.subscription = subscription
+        self.credit_window.open(subscription)
 
 
     def on_complete(self):
@@ -137,9 +142,10 @@ class ServerUploadSubscriber(DefaultSubscriber):
 #
 # ServerDownloadPublisher
 #
-# PURPOSES: Pushes bytes of a file to a client
+# PURPOSES: Pushes bytes of a file to a client, as long
+# as the client has granted credit for them.
 #
-class ServerDownloadPublisher(DefaultPublisher):
+class ServerDownloadPublisher(CreditPublisher):
     def complete(self):
         self._subscriber.on_complete()
 
@@ -157,6 +163,8 @@ class ServerDownloadPublisher(DefaultPublisher):
 #
 # PURPOSE: Listens for requests from the client to determine
 # when to send file data. Also reads the file to be sent.
+# Chunks are only read and sent while the client has granted
+# credit, sending resumes when more credit arrives.
 #
 # PARAMS:
 # user - user to whom we are sending the file
@@ -196,40 +204,70 @@ class ServerDownloadSubscriber(DefaultSubscriber):
 
     def on_next(self, value: bytes, is_complete=False):
         if is_complete:
+            # the client stopped receiving before the whole file was sent
+            self.stop_sending()
             return
         if self.error == None:
-            try:
-                # send the file
-                chunk = self.file_reader.read(self.chunk_size)
-                while chunk:
-                    logging.info(CHUNK_SENT.format(chunk))
-                    self.publisher.upload_bytes(create_byte_payload(chunk))
-                    chunk = self.file_reader.read(self.chunk_size)
-
-                # send complete messages
-                self.publisher.upload_bytes(create_byte_payload(COMPLETE.encode(ENCODE_TYPE)), True)
-                self.publisher.complete()
-            except Exception as e:
-                self.on_error(e)
+            # send the file as credit allows
+            self.publisher.on_credit = self.send_chunks
+            self.send_chunks()
         else:
             self.on_error(self.error)
 
 
+    #
+    # send_chunks
+    #
+    # PURPOSE: Sends chunks of the file until the client's
+    # credit runs out or the whole file has been sent.
+    #
+    def send_chunks(self):
+        try:
+            while self.file_reader != None and self.publisher.take_credit():
+                chunk = self.file_reader.read(self.chunk_size)
+                if not chunk:
+                    # send complete messages
+                    self.publisher.upload_bytes(create_byte_payload(COMPLETE.encode(ENCODE_TYPE)), True)
+                    self.stop_sending()
+                    return
+                logging.info(CHUNK_SENT.format(chunk))
+                self.publisher.upload_bytes(create_byte_payload(chunk))
+        except Exception as e:
+            self.on_error(e)
+
+
+    #
+    # stop_sending
+    #
+    # PURPOSE: Closes the file and completes the stream
+    # if the file is still being sent.
+    #
+    def stop_sending(self):
+        self.publisher.on_credit = None
+        if self.file_reader != None:
+            self.file_reader.close()
+            self.file_reader = None
+            self.publisher.complete()
+
+
     def on_error(self, exception: Exception):
         message = ACCESS_DENIED if isinstance(exception, AccessDeniedException) else DOWNLOAD_ERROR.format(self.filename, self.owner)
         print(message)
+        self.publisher.on_credit = None
         if self.file_reader != None:
             self.file_reader.close()
+            self.file_reader = None
         logging.error(exception)
         # return a message to the user
         self.publisher.error(RuntimeError(message))
 
 
+    # lets the client send the message that starts the download
     def on_subscribe(self, subscription: Subscription):
         self.subscription = subscription
+        subscription.request(1)
 
 
     def on_complete(self):
-        self.file_reader.close()
-        self.publisher.complete()
+        self.stop_sending()
         print(FILE_SENT.format(self.filename))
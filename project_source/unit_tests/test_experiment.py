@@ -1,10 +1,12 @@
+import json
 import os
 from pathlib import Path
 import unittest
+from rsocket.frame import frame_metrics
 from project_source.client_module.experiments.benchmark import Benchmark
 
 from project_source.client_module.experiments.experiment import Experiment
-from project_source.common.constants import CLIENT_MODULE, CSV_TEMPLATE, EXPERIMENT_DIR, LARGE_CHUNK, PROJECT_SRC, READ_BYTES, RESULTS_DIR
+from project_source.common.constants import CLIENT_MODULE, CSV_TEMPLATE, EXPERIMENT_DIR, FRAME_METRICS_TEMPLATE, LARGE_CHUNK, PROJECT_SRC, READ_BYTES, RESULTS_DIR
 
 class TestExperiment(unittest.TestCase):
     def test_create_experiment(self):
@@ -38,4 +40,30 @@ class TestExperiment(unittest.TestCase):
     def test_bad_filename(self):
         # an error will appear in the console
         experiment = Experiment("///BAD")
-        self.assertIsNotNone(experiment.error)
\ No newline at end of file
+        self.assertIsNotNone(experiment.error)
+
+    def test_save_frame_metrics(self):
+        experiment = Experiment("EXPERIMENT_TEST")
+        file_path = os.path.join(experiment.results_path, FRAME_METRICS_TEMPLATE.format("EXPERIMENT_TEST"))
+        frame_metrics.enable()
+
+        try:
+            frame_metrics.frames_out[0x0A] += 1
+            experiment.save_to_csv()
+            experiment.save_frame_metrics()
+
+            with open(file_path, "r") as f:
+                snapshot = json.load(f)
+            self.assertEqual(snapshot["frames_out"], {"PAYLOAD": 1})
+        finally:
+            frame_metrics.disable()
+            frame_metrics.reset()
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    def test_frame_metrics_disabled(self):
+        experiment = Experiment("EXPERIMENT_TEST")
+        file_path = os.path.join(experiment.results_path, FRAME_METRICS_TEMPLATE.format("EXPERIMENT_TEST"))
+        experiment.save_to_csv()
+        experiment.save_frame_metrics()
+        self.assertFalse(os.path.exists(file_path))
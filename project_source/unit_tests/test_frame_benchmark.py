@@ -0,0 +1,29 @@
+import unittest
+
+from project_source.benchmarks.frame_benchmark import frame_count, run_suite, MAX_FRAMES, MIN_FRAMES
+
+class TestFrameBenchmark(unittest.TestCase):
+    def test_frame_count(self):
+        self.assertEqual(frame_count(64, 64 * 1000), 1000)
+        self.assertEqual(frame_count(1024 * 1024, 1024), MIN_FRAMES)
+        self.assertEqual(frame_count(1, 10 * MAX_FRAMES), MAX_FRAMES)
+
+    def test_run_suite(self):
+        report = run_suite(sizes=[64, 2048], bytes_per_run=1, repeats=1)
+        self.assertEqual(report["frames_allocated_while_streaming"], 0)
+        self.assertEqual(
+            set(report["results"]),
+            {
+                "serialize",
+                "serialize_with_frame_size_header",
+                "serialize_buffers_with_frame_size_header",
+                "parse_or_ignore",
+                "fragmentation",
+                "receive_data",
+                "tcp_send"
+            }
+        )
+        result = report["results"]["parse_or_ignore"]["2048"]
+        self.assertEqual(result["frames"], MIN_FRAMES)
+        self.assertGreater(result["frames_per_second"], 0)
+        self.assertAlmostEqual(result["bytes_per_second"] / result["frames_per_second"], 2048, delta=1)
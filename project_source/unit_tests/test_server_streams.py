@@ -4,6 +4,7 @@ import unittest
 from project_source.client_module.client_streams import ClientDownloadPublisher, ClientDownloadSubscriber, ClientUploadSubscriber
 from reactivestreams.subscriber import DefaultSubscriber
 from reactivestreams.publisher import DefaultPublisher
+from rsocket.payload import Payload
 from project_source.common.constants import CHUNK_CAP, ENCODE_TYPE, LARGE_CHUNK
 
 from project_source.common.helpers import create_byte_payload
@@ -73,6 +74,30 @@ class TestServerStreams(unittest.TestCase):
             self.fail()
     
 
+    def test_receive_file_view_from_client(self):
+        try:
+            publisher = MockPublisher()
+            file_service = MockFileService()
+            subscriber = ServerUploadSubscriber(
+                "test_user",
+                "file.txt",
+                publisher,
+                file_service
+            )
+            # received chunks are views into the transport's buffer
+            payload = Payload()
+            payload.data = memoryview("test".encode(ENCODE_TYPE))
+            subscriber.on_next(payload)
+            self.assertIsNone(subscriber.error)
+            self.assertFalse(publisher.error_occurred)
+
+            subscriber.on_next(create_byte_payload(None), True)
+            self.assertTrue(publisher.completed)
+
+        except Exception as e:
+            self.fail()
+
+
     def test_receive_file_from_client_error(self):
         try:
             publisher = MockPublisher()
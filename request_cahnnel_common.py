@@ -7,8 +7,8 @@ from reactivestreams.publisher import Publisher
 from reactivestreams.subscriber import Subscriber, DefaultSubscriber
 from reactivestreams.subscription import Subscription
 from rsocket.frame import CancelFrame, ErrorFrame, RequestNFrame, \
-    PayloadFrame, Frame, error_frame_to_exception
-from rsocket.helpers import payload_from_frame
+    PayloadFrame, Frame, error_frame_to_exception, payload_frame_pool
+from rsocket.helpers import payload_view_from_frame
 from rsocket.logger import logger
 from rsocket.payload import Payload
 from rsocket.rsocket import RSocket
@@ -21,7 +21,6 @@ class StreamSubscriber(DefaultSubscriber):
         self._stream_id = stream_id
         self._socket = socket
         self._requester = requester
-        self.subscription = requester
 
     def on_next(self, value, is_complete=False):
         self._socket.send_payload(
@@ -62,7 +61,7 @@ class RequestChannelCommon(StreamHandler, Publisher, Subscription, metaclass=abc
 
     def frame_received(self, frame: Frame):
         if isinstance(frame, CancelFrame):
-            self.subscriber.subscription.cancel()
+            self._cancel_local_publisher()
             self.mark_completed_and_finish(sent=True)
         elif isinstance(frame, RequestNFrame):
             if self.subscriber.subscription is not None:
@@ -74,17 +73,26 @@ class RequestChannelCommon(StreamHandler, Publisher, Subscription, metaclass=abc
 
         elif isinstance(frame, PayloadFrame):
             if frame.flags_next:
-                self.remote_subscriber.on_next(payload_from_frame(frame),
+                self.remote_subscriber.on_next(payload_view_from_frame(frame),
                                                is_complete=frame.flags_complete)
             elif frame.flags_complete:
                 self.remote_subscriber.on_complete()
 
             if frame.flags_complete:
                 self.mark_completed_and_finish(received=True)
+
+            payload_frame_pool.release(frame)
         elif isinstance(frame, ErrorFrame):
             self.remote_subscriber.on_error(error_frame_to_exception(frame))
+            self._cancel_local_publisher()
             self.mark_completed_and_finish(received=True)
 
+    def _cancel_local_publisher(self):
+        # The publisher is the subscription of the stream subscriber, once
+        # the stream has failed or been cancelled it must stop sending.
+        if self.subscriber is not None and self.subscriber.subscription is not None:
+            self.subscriber.subscription.cancel()
+
     def _complete_remote_subscriber(self):
         if self.remote_subscriber is not None:
             self.remote_subscriber.on_complete()
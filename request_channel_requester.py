@@ -34,6 +34,9 @@ class RequestChannelRequester(RequestChannelCommon):
 
     def frame_received(self, frame: Frame):
         if isinstance(frame, RequestNFrame):
+            # Credit goes to the local publisher, the subscriber is then told
+            # that the other host is ready.
+            super().frame_received(frame)
             self.remote_subscriber.on_next(None)
             return
 
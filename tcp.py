@@ -0,0 +1,83 @@
+import time
+from asyncio import StreamReader, StreamWriter
+from typing import Optional, List, Union
+
+from rsocket.frame import Frame, serialize_buffers_with_frame_size_header, payload_frame_pool
+from rsocket.helpers import wrap_transport_exception
+from rsocket.transports.transport import Transport
+
+# Large enough to drain many small frames per read.
+READ_BUFFER_SIZE = 64 * 1024
+
+# Frames are written together once this many bytes are pending, or once the
+# oldest pending frame has waited this many seconds, or when the send queue empties.
+WRITE_BATCH_BYTES = 64 * 1024
+WRITE_BATCH_INTERVAL = 0.005
+
+
+class TransportTCP(Transport):
+    def __init__(self, reader: StreamReader, writer: StreamWriter):
+        super().__init__()
+        self._writer = writer
+        self._reader = reader
+        self._sent_frame: Optional[Frame] = None
+        self._batch: List[Union[bytes, memoryview]] = []
+        self._batch_bytes = 0
+        self._batch_started = 0.0
+
+    async def send_frame(self, frame: Frame):
+        self._release_sent_frame()
+
+        if not self._batch:
+            self._batch_started = time.monotonic()
+
+        for buffer in serialize_buffers_with_frame_size_header(frame):
+            self._batch.append(buffer)
+            self._batch_bytes += len(buffer)
+
+        self._sent_frame = frame
+
+        if (self._batch_bytes >= WRITE_BATCH_BYTES or
+                time.monotonic() - self._batch_started >= WRITE_BATCH_INTERVAL):
+            await self._flush_batch()
+
+    async def on_send_queue_empty(self):
+        self._release_sent_frame()
+        await self._flush_batch()
+
+    async def _flush_batch(self):
+        with wrap_transport_exception():
+            if self._batch:
+                self._writer.writelines(self._batch)
+                self._batch = []
+                self._batch_bytes = 0
+
+            await self._writer.drain()
+
+    def _release_sent_frame(self):
+        # The sender logs the frame and resolves its future after send_frame
+        # returns, so a frame is only returned to the pool on the next call.
+        if self._sent_frame is not None:
+            payload_frame_pool.release(self._sent_frame)
+            self._sent_frame = None
+
+    async def close(self):
+        if self._batch and not self._writer.is_closing():
+            self._writer.writelines(self._batch)
+            self._batch = []
+
+        self._writer.close()
+        await self._writer.wait_closed()
+
+    async def next_frame_generator(self):
+        with wrap_transport_exception():
+            data = await self._reader.read(READ_BUFFER_SIZE)
+
+            if not data:
+                self._writer.close()
+                return
+
+        return self._frame_parser.receive_data(data)
+
+    def requires_length_header(self) -> bool:
+        return True